@@ -18,11 +18,17 @@ def callop(instruction: Instruction):
 
     tx_id = instruction.call_context_lookup(CallContextFieldTag.TxId)
     reversion_info = instruction.reversion_info()
-    caller_address = instruction.call_context_lookup(CallContextFieldTag.CalleeAddress)
-    is_static = instruction.select(
-        is_staticcall, FQ(1), instruction.call_context_lookup(CallContextFieldTag.IsStatic)
+    caller_address, is_static, depth = (
+        word.value()
+        for word in instruction.call_context_lookup_words(
+            [
+                CallContextFieldTag.CalleeAddress,
+                CallContextFieldTag.IsStatic,
+                CallContextFieldTag.Depth,
+            ]
+        )
     )
-    depth = instruction.call_context_lookup(CallContextFieldTag.Depth)
+    is_static = instruction.select(is_staticcall, FQ(1), is_static)
     parent_caller_address, parent_call_value = (
         (
             instruction.call_context_lookup(CallContextFieldTag.CallerAddress),
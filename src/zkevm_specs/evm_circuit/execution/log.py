@@ -14,18 +14,23 @@ def log(instruction: Instruction):
     mstart = instruction.word_to_fq(instruction.stack_pop(), 8)
     msize = instruction.word_to_fq(instruction.stack_pop(), 8)
 
-    # read tx id
-    tx_id = instruction.call_context_lookup(CallContextFieldTag.TxId)
-    # check not static call
-    instruction.constrain_equal(
-        FQ(0), instruction.call_context_lookup(CallContextFieldTag.IsStatic)
+    # read tx id, is_static, callee address and is_persistent from call context
+    tx_id, is_static, contract_address, is_persistent = (
+        word.value()
+        for word in instruction.call_context_lookup_words(
+            [
+                CallContextFieldTag.TxId,
+                CallContextFieldTag.IsStatic,
+                CallContextFieldTag.CalleeAddress,
+                CallContextFieldTag.IsPersistent,
+            ]
+        )
     )
+    # check not static call
+    instruction.constrain_equal(FQ(0), is_static)
 
     # check contract_address in CallContext & TxLog
     # use call context's  callee address as contract address
-
-    contract_address = instruction.call_context_lookup(CallContextFieldTag.CalleeAddress)
-    is_persistent = instruction.call_context_lookup(CallContextFieldTag.IsPersistent)
     if instruction.is_zero(is_persistent) == 0:
         instruction.constrain_equal(
             contract_address,
@@ -1,22 +1,25 @@
 from __future__ import annotations
 from enum import IntEnum, auto
-from typing import Optional, Sequence, Tuple, Union, List, cast
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union, List, cast
 
-from eth_utils import (
-    keccak,
-)
 import rlp  # type: ignore
 
 from ..util import (
     FQ,
     IntOrFQ,
     add_words,
+    add_words_2,
+    mul_add_words_int,
+    mul_add_words_512_int,
     sum_values,
+    word_to_u64s,
     Word,
     WordOrValue,
     Expression,
     ExpressionImpl,
     cast_expr,
+    keccak256_bytes,
     MAX_N_BYTES,
     N_BYTES_ACCOUNT_ADDRESS,
     N_BYTES_MEMORY_ADDRESS,
@@ -47,6 +50,53 @@ from .table import (
     CopyDataTypeTag,
 )
 
+# Constant gas cost of each valid opcode, indexed by opcode byte.
+_CONSTANT_GAS_COST: Dict[int, int] = {int(opcode): opcode.constant_gas_cost() for opcode in Opcode}
+
+# Addresses of all supported precompiled contracts.
+_PRECOMPILE_ADDRS = frozenset(int(precompile) for precompile in Precompile)
+
+_range_table_tag = lru_cache(maxsize=None)(FixedTableTag.range_table_tag)
+
+
+@lru_cache(maxsize=None)
+def _fq_tag(tag: int) -> FQ:
+    """FQ of a table tag or field tag, built once per tag instead of on every lookup"""
+    return FQ(tag)
+
+
+# 256^n for every byte length an integer in the field can be composed of.
+_POW256 = tuple(1 << (8 * n_bytes) for n_bytes in range(MAX_N_BYTES + 1))
+
+# Field modulus and limb radix used by the word arithmetic gadgets.
+_P = FQ.field_modulus
+_FQ_2_128 = FQ(1 << 128)
+
+# Constants shared by the lookup and selector helpers instead of being rebuilt on every call.
+_FQ_ZERO = FQ(0)
+_FQ_ONE = FQ(1)
+_WORD_ZERO = Word(0)
+_FQ_RW_READ = _fq_tag(RW.Read)
+_FQ_RW_WRITE = _fq_tag(RW.Write)
+_FQ_TAG_STACK = _fq_tag(RWTableTag.Stack)
+
+# StepState fields that constrain_step_state_transition accepts.
+_STEP_STATE_TRANSITION_KEYS = frozenset(
+    [
+        "rw_counter",
+        "call_id",
+        "is_root",
+        "is_create",
+        "code_hash",
+        "program_counter",
+        "stack_pointer",
+        "gas_left",
+        "memory_word_size",
+        "reversible_write_counter",
+        "log_id",
+    ]
+)
+
 
 class ConstraintUnsatFailure(Exception):
     def __init__(self, message: str) -> None:
@@ -62,6 +112,8 @@ class TransitionKind(IntEnum):
 
 
 class Transition:
+    __slots__ = ("kind", "value")
+
     kind: TransitionKind
     value: Union[int, Expression, Word]
 
@@ -90,7 +142,105 @@ class Transition:
         return Transition(TransitionKind.ToWord, to)
 
 
+def _constrain_same(key: str, curr: Expression, next: Expression, value: Expression):
+    assert next.expr() == curr.expr(), ConstraintUnsatFailure(
+        f"State {key} should be same as {curr}, but got {next}"
+    )
+
+
+def _constrain_same_word(key: str, curr: Word, next: Word, value: Expression):
+    assert (
+        next.lo.expr() == curr.lo.expr() and next.hi.expr() == curr.hi.expr()
+    ), ConstraintUnsatFailure(f"State {key} should be same as {curr}, but got {next}")
+
+
+def _constrain_delta(key: str, curr: FQ, next: FQ, value: FQ):
+    assert next.expr() == curr.expr() + value.expr(), ConstraintUnsatFailure(
+        f"State {key} should transit to {curr} + {value} ({curr + value}), but got {next}"
+    )
+
+
+def _constrain_to(key: str, curr: FQ, next: FQ, value: FQ):
+    assert next.expr() == value.expr(), ConstraintUnsatFailure(
+        f"State {key} should transit to {value}, but got {next}"
+    )
+
+
+def _constrain_to_word(key: str, curr: Word, next: Word, value: Word):
+    assert (
+        next.lo.expr() == value.lo.expr() and next.hi.expr() == value.hi.expr()
+    ), ConstraintUnsatFailure(f"State {key} should transit to {value}, but got {next}")
+
+
+_STEP_STATE_TRANSITION_CONSTRAINTS: Dict[TransitionKind, Callable[[str, Any, Any, Any], None]] = {
+    TransitionKind.Same: _constrain_same,
+    TransitionKind.SameWord: _constrain_same_word,
+    TransitionKind.Delta: _constrain_delta,
+    TransitionKind.To: _constrain_to,
+    TransitionKind.ToWord: _constrain_to_word,
+}
+
+# Transitions of the fields that always stay the same within a context, shared by every step
+# instead of being rebuilt on each call.
+_TRANSITION_SAME = Transition.same()
+_TRANSITION_SAME_WORD = Transition.same_word()
+
+
+@lru_cache(maxsize=4096)
+def _compare_word(lhs_lo: int, lhs_hi: int, rhs_lo: int, rhs_hi: int) -> Tuple[int, int]:
+    """
+    Integer core of Instruction.compare_word. It's memoized on the limbs since the same words
+    (zero, sign masks, max_u256, ...) are compared over and over.
+    """
+    for limb in (lhs_lo, lhs_hi, rhs_lo, rhs_hi):
+        assert limb < _POW256[16], f"limb {hex(limb)} exceeds the range of 16 bytes"
+    hi_lt, hi_eq = int(lhs_hi < rhs_hi), int(lhs_hi == rhs_hi)
+    lo_lt, lo_eq = int(lhs_lo < rhs_lo), int(lhs_lo == rhs_lo)
+    return hi_lt + hi_eq * lo_lt, hi_eq * lo_eq
+
+
+def _create_rlp(address: bytes, nonce: int) -> bytes:
+    """
+    Same as rlp.encode([address, nonce]) for a 20-byte address and a nonce below 2^64, where the
+    whole payload is short enough to be prefixed by a single byte.
+    """
+    if nonce == 0:
+        encoded_nonce = b"\x80"
+    elif nonce < 0x80:
+        encoded_nonce = bytes((nonce,))
+    else:
+        nonce_len = (nonce.bit_length() + 7) // 8
+        encoded_nonce = bytes((0x80 + nonce_len,)) + nonce.to_bytes(nonce_len, "big")
+    return b"".join((bytes((0xC0 + 21 + len(encoded_nonce), 0x94)), address, encoded_nonce))
+
+
+@lru_cache(maxsize=4096)
+def _contract_address(address: int, nonce: int) -> int:
+    """Integer core of Instruction.generate_contract_address, memoized on (address, nonce)."""
+    address_bytes = address.to_bytes(20, "big")
+    if nonce < 1 << 64:
+        contract_addr = keccak256_bytes(_create_rlp(address_bytes, nonce))
+    else:
+        contract_addr = keccak256_bytes(rlp.encode([address_bytes, nonce]))
+    return int.from_bytes(contract_addr[-20:], "big")
+
+
+@lru_cache(maxsize=4096)
+def _create2_contract_address(address: int, salt: int, code_hash: int) -> int:
+    """Integer core of Instruction.generate_CREAET2_contract_address, memoized on its inputs."""
+    # keccak256(0xff + sender_address + salt + keccak256(initialisation_code))[12:]
+    contract_addr = keccak256_bytes(
+        b"\xff"
+        + address.to_bytes(20, "big")
+        + salt.to_bytes(32, "little")
+        + code_hash.to_bytes(32, "little")
+    )
+    return int.from_bytes(contract_addr[-20:], "big")
+
+
 class ReversionInfo:
+    __slots__ = ("rw_counter_end_of_reversion", "is_persistent", "reversible_write_counter")
+
     rw_counter_end_of_reversion: FQ
     is_persistent: FQ
     reversible_write_counter: FQ
@@ -112,6 +262,18 @@ class ReversionInfo:
 
 
 class Instruction:
+    __slots__ = (
+        "tables",
+        "curr",
+        "next",
+        "is_first_step",
+        "is_last_step",
+        "rw_counter_offset",
+        "program_counter_offset",
+        "stack_pointer_offset",
+        "log_index_offset",
+    )
+
     tables: Tables
     curr: StepState
     next: StepState
@@ -121,10 +283,10 @@ class Instruction:
     is_last_step: bool
 
     # helper numbers
-    rw_counter_offset: int = 0
-    program_counter_offset: int = 0
-    stack_pointer_offset: int = 0
-    log_index_offset: int = 0
+    rw_counter_offset: int
+    program_counter_offset: int
+    stack_pointer_offset: int
+    log_index_offset: int
 
     def __init__(
         self,
@@ -139,6 +301,10 @@ class Instruction:
         self.next = next
         self.is_first_step = is_first_step
         self.is_last_step = is_last_step
+        self.rw_counter_offset = 0
+        self.program_counter_offset = 0
+        self.stack_pointer_offset = 0
+        self.log_index_offset = 0
 
     def constrain_zero(self, value: Expression):
         assert value.expr() == 0, ConstraintUnsatFailure(f"Expected value to be 0, but got {value}")
@@ -197,25 +363,9 @@ class Instruction:
             assert curr in [ExecutionState.EndTx, ExecutionState.EndBlock]
 
     def constrain_step_state_transition(self, **kwargs: Transition):
-        keys = set(
-            [
-                "rw_counter",
-                "call_id",
-                "is_root",
-                "is_create",
-                "code_hash",
-                "program_counter",
-                "stack_pointer",
-                "gas_left",
-                "memory_word_size",
-                "reversible_write_counter",
-                "log_id",
-            ]
-        )
-
-        assert keys.issuperset(
+        assert _STEP_STATE_TRANSITION_KEYS.issuperset(
             kwargs.keys()
-        ), f"Invalid keys {list(set(kwargs.keys()).difference(keys))} for step state transition"
+        ), f"Invalid keys {list(set(kwargs.keys()).difference(_STEP_STATE_TRANSITION_KEYS))} for step state transition"
 
         for key, transition in kwargs.items():
             curr, next = getattr(self.curr, key), getattr(self.next, key)
@@ -225,36 +375,7 @@ class Instruction:
                 next = FQ(next)
             if isinstance(transition.value, int):
                 transition.value = FQ(transition.value)
-            if transition.kind == TransitionKind.Same:
-                assert next.expr() == curr.expr(), ConstraintUnsatFailure(
-                    f"State {key} should be same as {curr}, but got {next}"
-                )
-            elif transition.kind == TransitionKind.SameWord:
-                curr, next = cast(Word, curr), cast(Word, next)
-                assert next.lo.expr() == curr.lo.expr() and next.hi.expr() == curr.hi.expr(), ConstraintUnsatFailure(  # type: ignore
-                    f"State {key} should be same as {curr}, but got {next}"
-                )
-            elif transition.kind == TransitionKind.Delta:
-                curr, next = cast(FQ, curr), cast(FQ, next)
-                value = cast(FQ, transition.value)
-                assert next.expr() == curr.expr() + value.expr(), ConstraintUnsatFailure(
-                    f"State {key} should transit to {curr} + {transition.value} ({curr + transition.value}), but got {next}"
-                )
-            elif transition.kind == TransitionKind.To:
-                curr, next = cast(FQ, curr), cast(FQ, next)
-                value = cast(FQ, transition.value)
-                assert next.expr() == value.expr(), ConstraintUnsatFailure(
-                    f"State {key} should transit to {transition.value}, but got {next}"
-                )
-            elif transition.kind == TransitionKind.ToWord:
-                curr, next = cast(Word, curr), cast(Word, next)
-                # mypy gets confused here and thinkgs value must be FQ.
-                value = cast(Word, transition.value)  # type: ignore
-                assert next.lo.expr() == value.lo.expr() and next.hi.expr() == value.hi.expr(), ConstraintUnsatFailure(  # type: ignore
-                    f"State {key} should transit to {transition.value}, but got {next}"
-                )
-            else:
-                raise ValueError("Unreacheable")
+            _STEP_STATE_TRANSITION_CONSTRAINTS[transition.kind](key, curr, next, transition.value)
 
     def step_state_transition_to_new_context(
         self,
@@ -304,9 +425,8 @@ class Instruction:
             caller_gas_left,
             caller_memory_size,
             caller_reversible_write_counter,
-        ] = [
-            self.call_context_lookup_word(field_tag, call_id=caller_id)
-            for field_tag in [
+        ] = self.call_context_lookup_words(
+            [
                 CallContextFieldTag.IsRoot,
                 CallContextFieldTag.IsCreate,
                 CallContextFieldTag.CodeHash,
@@ -315,8 +435,9 @@ class Instruction:
                 CallContextFieldTag.GasLeft,
                 CallContextFieldTag.MemorySize,
                 CallContextFieldTag.ReversibleWriteCounter,
-            ]
-        ]
+            ],
+            call_id=caller_id,
+        )
 
         # Update caller's last callee information
         for field_tag, expected_value in [
@@ -358,17 +479,17 @@ class Instruction:
     def step_state_transition_in_same_context(
         self,
         opcode: Expression,
-        rw_counter: Transition = Transition.same(),
-        program_counter: Transition = Transition.same(),
-        stack_pointer: Transition = Transition.same(),
-        memory_word_size: Transition = Transition.same(),
-        reversible_write_counter: Transition = Transition.same(),
+        rw_counter: Transition = _TRANSITION_SAME,
+        program_counter: Transition = _TRANSITION_SAME,
+        stack_pointer: Transition = _TRANSITION_SAME,
+        memory_word_size: Transition = _TRANSITION_SAME,
+        reversible_write_counter: Transition = _TRANSITION_SAME,
         dynamic_gas_cost: IntOrFQ = 0,
-        log_id: Transition = Transition.same(),
+        log_id: Transition = _TRANSITION_SAME,
     ):
         self.responsible_opcode_lookup(opcode)
 
-        gas_cost = FQ(Opcode(opcode.expr().n).constant_gas_cost() + dynamic_gas_cost)
+        gas_cost = FQ(_CONSTANT_GAS_COST[opcode.expr().n] + dynamic_gas_cost)
         self.constrain_gas_left_not_underflow(self.curr.gas_left - gas_cost)
 
         self.constrain_step_state_transition(
@@ -380,10 +501,10 @@ class Instruction:
             reversible_write_counter=reversible_write_counter,
             log_id=log_id,
             # Always stay same
-            call_id=Transition.same(),
-            is_root=Transition.same(),
-            is_create=Transition.same(),
-            code_hash=Transition.same_word(),
+            call_id=_TRANSITION_SAME,
+            is_root=_TRANSITION_SAME,
+            is_create=_TRANSITION_SAME,
+            code_hash=_TRANSITION_SAME_WORD,
         )
 
     def sum(self, values: Sequence[IntOrFQ]) -> FQ:
@@ -396,9 +517,7 @@ class Instruction:
         return self.is_zero(lhs.expr() - rhs.expr())
 
     def is_equal_word(self, lhs: Word, rhs: Word) -> FQ:
-        return self.is_zero_word(
-            Word((lhs.lo.expr() - rhs.lo.expr(), lhs.hi.expr() - rhs.hi.expr()), check=False)
-        )
+        return FQ(lhs.lo.expr() == rhs.lo.expr() and lhs.hi.expr() == rhs.hi.expr())
 
     def continuous_selectors(self, value: Expression, n: int) -> Sequence[FQ]:
         return [FQ(i < value.expr().n) for i in range(n)]
@@ -418,7 +537,8 @@ class Instruction:
         return lhs_eq, rhs_eq
 
     def multiple_select(self, value: Expression, options: Tuple[Expression, ...]) -> Tuple[FQ, ...]:
-        return tuple(FQ(value.expr() == o.expr()) for o in options)
+        value_expr = value.expr()
+        return tuple(_FQ_ONE if value_expr == o.expr() else _FQ_ZERO for o in options)
 
     def constant_divmod(
         self, numerator: Expression, denominator: Expression, n_bytes: int
@@ -427,11 +547,17 @@ class Instruction:
         self.range_check(FQ(quotient), n_bytes)
         return FQ(quotient), FQ(remainder)
 
-    def compare(self, lhs: Expression, rhs: Expression, n_bytes: int) -> Tuple[FQ, FQ]:
+    def _compare_operands(self, lhs: Expression, rhs: Expression, n_bytes: int) -> Tuple[int, int]:
+        """Range check both operands of a comparison and return their values"""
         assert n_bytes <= MAX_N_BYTES, "Too many bytes to composite an integer in field"
-        assert lhs.expr().n < 256**n_bytes, f"lhs {lhs} exceeds the range of {n_bytes} bytes"
-        assert rhs.expr().n < 256**n_bytes, f"rhs {rhs} exceeds the range of {n_bytes} bytes"
-        return FQ(lhs.expr().n < rhs.expr().n), FQ(lhs.expr().n == rhs.expr().n)
+        lhs_n, rhs_n = lhs.expr().n, rhs.expr().n
+        assert lhs_n < _POW256[n_bytes], f"lhs {lhs} exceeds the range of {n_bytes} bytes"
+        assert rhs_n < _POW256[n_bytes], f"rhs {rhs} exceeds the range of {n_bytes} bytes"
+        return lhs_n, rhs_n
+
+    def compare(self, lhs: Expression, rhs: Expression, n_bytes: int) -> Tuple[FQ, FQ]:
+        lhs_n, rhs_n = self._compare_operands(lhs, rhs, n_bytes)
+        return FQ(lhs_n < rhs_n), FQ(lhs_n == rhs_n)
 
     def compare_word(self, lhs: Word, rhs: Word) -> Tuple[FQ, FQ]:
         """
@@ -439,61 +565,68 @@ class Instruction:
         The first output value is 1 if the left-hand side is strictly smaller, 0 otherwise.
         The second output value is 1 if the left-hand side is equal to the right-hand side, 0 otherwise.
         """
-        lhs_lo, lhs_hi = lhs.to_lo_hi()
-        rhs_lo, rhs_hi = rhs.to_lo_hi()
-        hi_lt, hi_eq = self.compare(lhs_hi, rhs_hi, 16)
-        lo_lt, lo_eq = self.compare(lhs_lo, rhs_lo, 16)
-        return FQ(hi_lt + hi_eq * lo_lt), FQ(hi_eq * lo_eq)
+        lhs_lo, lhs_hi = lhs.lo.expr(), lhs.hi.expr()
+        rhs_lo, rhs_hi = rhs.lo.expr(), rhs.hi.expr()
+        lt, eq = _compare_word(lhs_lo.n, lhs_hi.n, rhs_lo.n, rhs_hi.n)
+        return FQ(lt), FQ(eq)
 
     def precompile(self, address: Expression) -> FQ:
-        try:
-            Precompile(address.expr().n)
-            return FQ(1)
-        except ValueError:
-            return FQ(0)
+        return _FQ_ONE if address.expr().n in _PRECOMPILE_ADDRS else _FQ_ZERO
 
     def min(self, lhs: Expression, rhs: Expression, n_bytes: int) -> FQ:
-        lt, _ = self.compare(lhs, rhs, n_bytes)
-        return cast_expr(self.select(lt, lhs, rhs), FQ)
+        lhs_n, rhs_n = self._compare_operands(lhs, rhs, n_bytes)
+        return FQ(lhs_n if lhs_n < rhs_n else rhs_n)
 
     def max(self, lhs: Expression, rhs: Expression, n_bytes: int) -> FQ:
-        lt, _ = self.compare(lhs, rhs, n_bytes)
-        return cast_expr(self.select(lt, rhs, lhs), FQ)
+        lhs_n, rhs_n = self._compare_operands(lhs, rhs, n_bytes)
+        return FQ(rhs_n if lhs_n < rhs_n else lhs_n)
+
+    def max3(self, a: Expression, b: Expression, c: Expression, n_bytes: int) -> FQ:
+        """Same as max(a, max(b, c)), range checking each operand once"""
+        a_n, b_n = self._compare_operands(a, b, n_bytes)
+        c_n = c.expr().n
+        assert c_n < _POW256[n_bytes], f"c {c} exceeds the range of {n_bytes} bytes"
+        return FQ(max(a_n, b_n, c_n))
 
     def word_to_fq(self, word: Word, n_bytes: int) -> FQ:
-        word_le_bytes = word.to_le_bytes()
-        if sum(word_le_bytes[n_bytes:]) != FQ(0):
+        assert n_bytes <= MAX_N_BYTES, "Too many bytes to composite an integer in field"
+        value = word.int_value()
+        if value >> (8 * n_bytes):
             raise ConstraintUnsatFailure(f"Word {word} has too many bytes to fit {n_bytes} bytes")
-        return self.bytes_to_fq(word_le_bytes[:n_bytes])
+        return FQ(value)
 
     def is_neg_word(self, word: Word) -> FQ:
-        return self.compare(FQ(0x7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF), word.hi.expr(), 16)[0]
+        # Compares 0x7FFF... < word.hi as 16-byte values. Both go in the hi limb with zero lo
+        # limbs, so the memoized word comparison can be reused.
+        return FQ(_compare_word(0, 0x7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF, 0, word.hi.expr().n)[0])
 
     def is_zero_word(self, word: Word) -> FQ:
-        return self.is_zero(self.sum([word.lo.expr(), word.hi.expr()]))
+        return self.is_zero(word.lo.expr() + word.hi.expr())
 
     def byte_size(self, word: Word) -> FQ:
-        le_bytes = [b.n for b in word.to_le_bytes()]
-        return FQ(len(bytearray(le_bytes).rstrip(b"\x00")))
+        lo, hi = word.lo.expr().n, word.hi.expr().n
+        if hi != 0:
+            return FQ(16 + (hi.bit_length() + 7) // 8)
+        return FQ((lo.bit_length() + 7) // 8)
 
     def bytes_to_fq(self, value: Union[bytes, Sequence[FQ]], constrained=False) -> FQ:
         if not isinstance(value, bytes):
             value = bytes([b.n for b in value])
         assert len(value) <= MAX_N_BYTES, "Too many bytes to composite an integer in field"
 
-        fq = FQ(int.from_bytes(value, "little"))
+        expr = int.from_bytes(value, "little")
+        fq = FQ(expr)
 
         if constrained:
-            expr = sum(list(map(lambda x: (256 ** x[0]) * x[1], enumerate(list(value)))))
             self.constrain_equal(fq, FQ(expr))
 
         return fq
 
     def address_to_word(self, addr: Expression) -> Word:
         """Verify that address is 160 bits and return it as a Word (lo, hi)"""
-        addr_bytes = addr.expr().n.to_bytes(32, "little")
-        self.constrain_zero(FQ(sum(addr_bytes[N_BYTES_ACCOUNT_ADDRESS:])))
-        return Word(addr_bytes)
+        addr_int = addr.expr().n
+        self.constrain_zero(FQ(addr_int >> (8 * N_BYTES_ACCOUNT_ADDRESS)))
+        return Word(addr_int)
 
     def word_to_address(self, word: Word) -> Expression:
         """Verify that word is 160 bits and return it as a single value"""
@@ -504,16 +637,14 @@ class Instruction:
         return self.word_to_fq(word, 8)
 
     def range_lookup(self, value: Expression, range: int):
-        self.fixed_lookup(FixedTableTag.range_table_tag(range), value)
+        self.fixed_lookup(_range_table_tag(range), value)
 
     def byte_range_lookup(self, value: Expression):
         self.range_lookup(value, 256)
 
-    def range_check(self, value: Expression, n_bytes: int) -> bytes:
+    def range_check(self, value: Expression, n_bytes: int):
         assert n_bytes <= MAX_N_BYTES, "Too many bytes to composite an integer in field"
-        try:
-            return value.expr().n.to_bytes(n_bytes, "little")
-        except OverflowError:
+        if value.expr().n >= _POW256[n_bytes]:
             raise ConstraintUnsatFailure(f"Value {value} has too many bytes to fit {n_bytes} bytes")
 
     # Return a tuple of `abs(x)` and `x_is_neg`. For a special case when
@@ -525,8 +656,8 @@ class Instruction:
         # Generate the witness `x_abs`.
         x_abs = x if is_neg == 0 else Word((1 << 256) - x.int_value())
 
-        x_abs_lo, x_abs_hi = x_abs.to_lo_hi()
-        x_lo, x_hi = x.to_lo_hi()
+        x_abs_lo, x_abs_hi = x_abs.lo.expr(), x_abs.hi.expr()
+        x_lo, x_hi = x.lo.expr(), x.hi.expr()
 
         # Constrain `x_abs_lo == x_lo` and `x_abs_hi == x_hi` if non negative.
         self.constrain_zero((x_abs_lo - x_lo) * (1 - is_neg))
@@ -539,11 +670,11 @@ class Instruction:
         carry_hi, sum_hi = divmod(x_hi.n + x_abs_hi.n + carry_lo, 1 << 128)
 
         # Contrain `sum([x_lo, x_abs_lo]) == sum_lo + carry_lo * 2^128`.
-        self.constrain_zero(FQ(sum_lo) + FQ(carry_lo) * FQ(1 << 128) - self.sum([x_lo, x_abs_lo]))
+        self.constrain_zero(FQ(sum_lo) + FQ(carry_lo) * _FQ_2_128 - self.sum([x_lo, x_abs_lo]))
 
         # Contrain `sum([x_hi, x_abs_hi]) + carry_lo == sum_hi + carry_hi * 2^128`.
         self.constrain_zero(
-            FQ(sum_hi) + FQ(carry_hi) * FQ(1 << 128) - FQ(carry_lo) - self.sum([x_hi, x_abs_hi])
+            FQ(sum_hi) + FQ(carry_hi) * _FQ_2_128 - FQ(carry_lo) - self.sum([x_hi, x_abs_hi])
         )
 
         # When `is_neg`, constrain both low and high remainders are zero, and
@@ -556,9 +687,12 @@ class Instruction:
     def add_words(self, addends: Sequence[Word]) -> Tuple[Word, FQ]:
         return add_words(addends)
 
+    def add_words_2(self, a: Word, b: Word) -> Tuple[Word, FQ]:
+        return add_words_2(a, b)
+
     def sub_word(self, minuend: Word, subtrahend: Word) -> Tuple[Word, FQ]:
-        minuend_lo, minuend_hi = minuend.to_lo_hi()
-        subtrahend_lo, subtrahend_hi = subtrahend.to_lo_hi()
+        minuend_lo, minuend_hi = minuend.lo.expr(), minuend.hi.expr()
+        subtrahend_lo, subtrahend_hi = subtrahend.lo.expr(), subtrahend.hi.expr()
 
         borrow_lo = minuend_lo.n < subtrahend_lo.n
         diff_lo = minuend_lo - subtrahend_lo + (1 << 128 if borrow_lo else 0)
@@ -568,7 +702,7 @@ class Instruction:
         return Word((diff_lo, diff_hi)), FQ(borrow_hi)
 
     def mul_word_by_u64(self, multiplicand: Word, multiplier: Expression) -> Tuple[Word, FQ]:
-        multiplicand_lo, multiplicand_hi = multiplicand.to_lo_hi()
+        multiplicand_lo, multiplicand_hi = multiplicand.lo.expr(), multiplicand.hi.expr()
 
         quotient_lo, product_lo = divmod((multiplicand_lo * multiplier.expr()).n, 1 << 128)
         quotient_hi, product_hi = divmod(
@@ -584,99 +718,78 @@ class Instruction:
         The function constrains a * b + c == d, where a, b, c, d are 256-bit words.
         It returns the overflow part of a * b + c.
         """
-        a64s = a.to_64s()
-        b64s = b.to_64s()
-        c_lo, c_hi = c.to_lo_hi()
-        d_lo, d_hi = d.to_lo_hi()
-
-        t0 = a64s[0] * b64s[0]
-        t1 = a64s[0] * b64s[1] + a64s[1] * b64s[0]
-        t2 = a64s[0] * b64s[2] + a64s[1] * b64s[1] + a64s[2] * b64s[0]
-        t3 = a64s[0] * b64s[3] + a64s[1] * b64s[2] + a64s[2] * b64s[1] + a64s[3] * b64s[0]
-        carry_lo = (t0 + (t1 * 2**64) + c_lo - d_lo) / (2**128)
-        carry_hi = (t2 + (t3 * 2**64) + c_hi + carry_lo - d_hi) / (2**128)
-        overflow = (
-            carry_hi
-            + a64s[1] * b64s[3]
-            + a64s[2] * b64s[2]
-            + a64s[3] * b64s[1]
-            + a64s[2] * b64s[3]
-            + a64s[3] * b64s[2]
-            + a64s[3] * b64s[3]
+        lo_sum, hi_sum, carry_lo, carry_hi, overflow = mul_add_words_int(
+            word_to_u64s(a),
+            word_to_u64s(b),
+            c.lo.expr().n,
+            c.hi.expr().n,
+            d.lo.expr().n,
+            d.hi.expr().n,
         )
 
         # range check for carries
-        self.range_check(carry_lo, 9)
-        self.range_check(carry_hi, 9)
+        self.range_check(FQ(carry_lo), 9)
+        self.range_check(FQ(carry_hi), 9)
 
-        self.constrain_equal(t0 + t1 * (2**64) + c_lo, d_lo + carry_lo * (2**128))
-        self.constrain_equal(t2 + t3 * (2**64) + c_hi + carry_lo, d_hi + carry_hi * (2**128))
+        self.constrain_equal(FQ(lo_sum), d.lo.expr() + FQ(carry_lo << 128))
+        self.constrain_equal(FQ(hi_sum), d.hi.expr() + FQ(carry_hi << 128))
 
-        return overflow
+        return FQ(overflow)
 
     def mul_add_words_512(self, a: Word, b: Word, c: Word, d: Word, e: Word):
         """
         The function constrains a * b + c == d * 2**256 + e, where a, b, c, d are 256-bit words.
         """
-        a64s = a.to_64s()
-        b64s = b.to_64s()
-        c_lo, c_hi = c.to_lo_hi()
-        d_lo, d_hi = d.to_lo_hi()
-        e_lo, e_hi = e.to_lo_hi()
-
-        t0 = a64s[0] * b64s[0]
-        t1 = a64s[0] * b64s[1] + a64s[1] * b64s[0]
-        t2 = a64s[0] * b64s[2] + a64s[1] * b64s[1] + a64s[2] * b64s[0]
-        t3 = a64s[0] * b64s[3] + a64s[1] * b64s[2] + a64s[2] * b64s[1] + a64s[3] * b64s[0]
-
-        t4 = a64s[1] * b64s[3] + a64s[2] * b64s[2] + a64s[3] * b64s[1]
-        t5 = a64s[2] * b64s[3] + a64s[3] * b64s[2]
-        t6 = a64s[3] * b64s[3]
-
-        carry_0 = (t0 + t1 * (2**64) + c_lo - e_lo) / (2**128)
-        carry_1 = (t2 + t3 * (2**64) + c_hi + carry_0 - e_hi) / (2**128)
-        carry_2 = (t4 + t5 * (2**64) + carry_1 - d_lo) / (2**128)
+        sum_0, sum_1, sum_2, carry_0, carry_1, carry_2, sum_3 = mul_add_words_512_int(
+            word_to_u64s(a),
+            word_to_u64s(b),
+            c.lo.expr().n,
+            c.hi.expr().n,
+            d.lo.expr().n,
+            e.lo.expr().n,
+            e.hi.expr().n,
+        )
 
         # range check for carries
-        self.range_check(carry_0, 9)
-        self.range_check(carry_1, 9)
-        self.range_check(carry_2, 9)
+        self.range_check(FQ(carry_0), 9)
+        self.range_check(FQ(carry_1), 9)
+        self.range_check(FQ(carry_2), 9)
 
-        self.constrain_equal(t0 + t1 * (2**64) + c_lo, e_lo + carry_0 * (2**128))
-        self.constrain_equal(t2 + t3 * (2**64) + c_hi + carry_0, e_hi + carry_1 * (2**128))
-        self.constrain_equal(t4 + t5 * (2**64) + carry_1, d_lo + carry_2 * (2**128))
-        self.constrain_equal(t6 + carry_2, d_hi)
+        self.constrain_equal(FQ(sum_0), e.lo.expr() + FQ(carry_0 << 128))
+        self.constrain_equal(FQ(sum_1), e.hi.expr() + FQ(carry_1 << 128))
+        self.constrain_equal(FQ(sum_2), d.lo.expr() + FQ(carry_2 << 128))
+        self.constrain_equal(FQ(sum_3), d.hi.expr())
 
     def fixed_lookup(
         self,
         tag: FixedTableTag,
         value0: Expression,
-        value1: Expression = FQ(0),
-        value2: Expression = FQ(0),
+        value1: Expression = _FQ_ZERO,
+        value2: Expression = _FQ_ZERO,
     ) -> FixedTableRow:
-        return self.tables.fixed_lookup(FQ(tag), value0, value1, value2)
+        return self.tables.fixed_lookup(_fq_tag(tag), value0, value1, value2)
 
     def block_context_lookup(
-        self, field_tag: BlockContextFieldTag, block_number: Expression = FQ(0)
+        self, field_tag: BlockContextFieldTag, block_number: Expression = _FQ_ZERO
     ) -> Expression:
-        return self.tables.block_lookup(FQ(field_tag), block_number).value.value()
+        return self.tables.block_lookup(_fq_tag(field_tag), block_number).value.value()
 
     def block_context_lookup_word(
-        self, field_tag: BlockContextFieldTag, block_number: Expression = FQ(0)
+        self, field_tag: BlockContextFieldTag, block_number: Expression = _FQ_ZERO
     ) -> WordOrValue:
-        return self.tables.block_lookup(FQ(field_tag), block_number).value
+        return self.tables.block_lookup(_fq_tag(field_tag), block_number).value
 
     def tx_context_lookup(self, tx_id: Expression, field_tag: TxContextFieldTag) -> Expression:
-        return self.tables.tx_lookup(tx_id, FQ(field_tag)).value.value()
+        return self.tables.tx_lookup(tx_id, _fq_tag(field_tag)).value.value()
 
     def tx_context_lookup_word(
         self, tx_id: Expression, field_tag: TxContextFieldTag
     ) -> WordOrValue:
-        return self.tables.tx_lookup(tx_id, FQ(field_tag)).value
+        return self.tables.tx_lookup(tx_id, _fq_tag(field_tag)).value
 
     def tx_calldata_lookup(self, tx_id: Expression, call_data_index: Expression) -> Expression:
         return (
-            self.tables.tx_lookup(tx_id, FQ(TxContextFieldTag.CallData), call_data_index)
+            self.tables.tx_lookup(tx_id, _fq_tag(TxContextFieldTag.CallData), call_data_index)
             .value.value()
             .expr()
         )
@@ -697,8 +810,8 @@ class Instruction:
             RWTableTag.TxLog,
             id=tx_id,
             address=FQ(index + (int(field_tag) << 32) + (log_id.expr().n << 48)),
-            field_tag=FQ(0),
-            storage_key=Word(0),
+            field_tag=_FQ_ZERO,
+            storage_key=_WORD_ZERO,
         ).value
         return value
 
@@ -713,9 +826,9 @@ class Instruction:
             RW.Read,
             RWTableTag.TxReceipt,
             id=tx_id,
-            address=FQ(0),
-            field_tag=FQ(field_tag),
-            storage_key=Word(0),
+            address=_FQ_ZERO,
+            field_tag=_fq_tag(field_tag),
+            storage_key=_WORD_ZERO,
             rw_counter=rw_counter,
         ).value
         return value.value().expr()
@@ -730,9 +843,9 @@ class Instruction:
             RW.Write,
             RWTableTag.TxReceipt,
             id=tx_id,
-            address=FQ(0),
-            field_tag=FQ(field_tag),
-            storage_key=Word(0),
+            address=_FQ_ZERO,
+            field_tag=_fq_tag(field_tag),
+            storage_key=_WORD_ZERO,
         ).value
         return value.value().expr()
 
@@ -741,25 +854,25 @@ class Instruction:
         self, bytecode_hash: Word, index: Expression, is_code: Optional[Expression] = None
     ) -> Expression:
         return self.tables.bytecode_lookup(
-            bytecode_hash, FQ(BytecodeFieldTag.Byte), index, is_code
+            bytecode_hash, _fq_tag(BytecodeFieldTag.Byte), index, is_code
         ).value
 
     # lookup value and is_code pair
     def bytecode_lookup_pair(
         self, bytecode_hash: Word, index: Expression
     ) -> Tuple[Expression, Expression]:
-        rw = self.tables.bytecode_lookup(bytecode_hash, FQ(BytecodeFieldTag.Byte), index, None)
+        rw = self.tables.bytecode_lookup(bytecode_hash, _fq_tag(BytecodeFieldTag.Byte), index, None)
         return rw.value, rw.is_code
 
     def bytecode_length(self, bytecode_hash: Word) -> Expression:
         return self.tables.bytecode_lookup(
-            bytecode_hash, FQ(BytecodeFieldTag.Header), FQ(0), FQ(0)
+            bytecode_hash, _fq_tag(BytecodeFieldTag.Header), _FQ_ZERO, _FQ_ZERO
         ).value
 
     def tx_gas_price(self, tx_id: Expression) -> Word:
         return self.tx_context_lookup_word(tx_id, TxContextFieldTag.GasPrice)
 
-    def responsible_opcode_lookup(self, opcode: Expression, aux: Expression = FQ(0)):
+    def responsible_opcode_lookup(self, opcode: Expression, aux: Expression = _FQ_ZERO):
         self.fixed_lookup(
             FixedTableTag.ResponsibleOpcode, FQ(self.curr.execution_state), opcode, aux
         )
@@ -788,15 +901,15 @@ class Instruction:
         if rw_counter is None:
             rw_counter = self.curr.rw_counter + self.rw_counter_offset
             self.rw_counter_offset += 1
-        if value is not None:
+        if value is not None and not isinstance(value, WordOrValue):
             value = WordOrValue(value)
-        if value_prev is not None:
+        if value_prev is not None and not isinstance(value_prev, WordOrValue):
             value_prev = WordOrValue(value_prev)
 
         return self.tables.rw_lookup(
             rw_counter,
-            FQ(rw),
-            FQ(tag),
+            _fq_tag(rw),
+            _fq_tag(tag),
             id,
             address,
             field_tag,
@@ -806,6 +919,17 @@ class Instruction:
             aux0,
         )
 
+    def rw_key_lookup(
+        self, rw: RW, tag: RWTableTag, id: Expression, address: Expression
+    ) -> RWTableRow:
+        """Fast path of rw_lookup for accesses that only pin down the id and address"""
+        return self._rw_key_lookup(_fq_tag(rw), _fq_tag(tag), id, address)
+
+    def _rw_key_lookup(self, rw: FQ, tag: FQ, id: Expression, address: Expression) -> RWTableRow:
+        rw_counter = self.curr.rw_counter + self.rw_counter_offset
+        self.rw_counter_offset += 1
+        return self.tables.rw_key_lookup(rw_counter, rw, tag, id, address)
+
     def state_write(
         self,
         tag: RWTableTag,
@@ -819,11 +943,6 @@ class Instruction:
         reversion_info: Optional[ReversionInfo] = None,
     ) -> RWTableRow:
         assert tag.write_with_reversion()
-        if value is not None:
-            value = WordOrValue(value)
-        if value_prev is not None:
-            value_prev = WordOrValue(value_prev)
-
         row = self.rw_lookup(
             RW.Write, tag, id, address, field_tag, storage_key, value, value_prev, aux0
         )
@@ -831,8 +950,8 @@ class Instruction:
         if reversion_info is not None and reversion_info.is_persistent == FQ(0):
             self.tables.rw_lookup(
                 rw_counter=reversion_info.rw_counter_of_reversion(),
-                rw=FQ(RW.Write),
-                tag=FQ(tag),
+                rw=_fq_tag(RW.Write),
+                tag=_fq_tag(tag),
                 id=row.id,
                 address=row.address,
                 field_tag=row.field_tag,
@@ -856,10 +975,6 @@ class Instruction:
         value_prev: Optional[Union[Word, Expression]] = None,
         aux0: Optional[Word] = None,
     ) -> RWTableRow:
-        if value is not None:
-            value = WordOrValue(value)
-        if value_prev is not None:
-            value_prev = WordOrValue(value_prev)
         row = self.rw_lookup(
             RW.Read, tag, id, address, field_tag, storage_key, value, value_prev, aux0
         )
@@ -875,20 +990,39 @@ class Instruction:
     ) -> WordOrValue:
         if call_id is None:
             call_id = self.curr.call_id
-        return self.rw_lookup(rw, RWTableTag.CallContext, call_id, FQ(field_tag)).value
+        return self.rw_key_lookup(rw, RWTableTag.CallContext, call_id, _fq_tag(field_tag)).value
+
+    def call_context_lookup_words(
+        self,
+        field_tags: Sequence[CallContextFieldTag],
+        rw: RW = RW.Read,
+        call_id: Optional[Expression] = None,
+    ) -> List[WordOrValue]:
+        """
+        Look up several fields of a call context at consecutive rw_counters, bumping
+        rw_counter_offset once for the whole batch
+        """
+        if call_id is None:
+            call_id = self.curr.call_id
+        rw_counter = self.curr.rw_counter + self.rw_counter_offset
+        self.rw_counter_offset += len(field_tags)
+        rw_fq, tag_fq = _fq_tag(rw), _fq_tag(RWTableTag.CallContext)
+        return [
+            self.tables.rw_key_lookup(
+                rw_counter + idx, rw_fq, tag_fq, call_id, _fq_tag(field_tag)
+            ).value
+            for idx, field_tag in enumerate(field_tags)
+        ]
 
     def rw_table_start_lookup(self, counter: Expression):
         # Raises exception if no lookup matches
         self.rw_lookup(rw=RW.Read, tag=RWTableTag.Start, rw_counter=counter)
 
     def reversion_info(self, call_id: Optional[Expression] = None) -> ReversionInfo:
-        [rw_counter_end_of_reversion, is_persistent] = [
-            self.call_context_lookup(tag, call_id=call_id)
-            for tag in [
-                CallContextFieldTag.RwCounterEndOfReversion,
-                CallContextFieldTag.IsPersistent,
-            ]
-        ]
+        rw_counter_end_of_reversion = self.call_context_lookup(
+            CallContextFieldTag.RwCounterEndOfReversion, call_id=call_id
+        )
+        is_persistent = self.call_context_lookup(CallContextFieldTag.IsPersistent, call_id=call_id)
         return ReversionInfo(
             rw_counter_end_of_reversion,
             is_persistent,
@@ -898,27 +1032,31 @@ class Instruction:
     def stack_pop(self) -> Word:
         stack_pointer_offset = self.stack_pointer_offset
         self.stack_pointer_offset += 1
-        return self.stack_lookup(RW.Read, FQ(stack_pointer_offset))
+        return self._rw_stack(_FQ_RW_READ, stack_pointer_offset)
 
     def stack_push(self) -> Word:
         self.stack_pointer_offset -= 1
-        return self.stack_lookup(RW.Write, FQ(self.stack_pointer_offset))
+        return self._rw_stack(_FQ_RW_WRITE, self.stack_pointer_offset)
+
+    def stack_lookup(self, rw: RW, stack_pointer_offset: Union[int, Expression]) -> Word:
+        return self._rw_stack(_fq_tag(rw), stack_pointer_offset)
 
-    def stack_lookup(self, rw: RW, stack_pointer_offset: Expression) -> Word:
+    def _rw_stack(self, rw: FQ, stack_pointer_offset: Union[int, Expression]) -> Word:
         stack_pointer = self.curr.stack_pointer + stack_pointer_offset
-        return self.rw_lookup(rw, RWTableTag.Stack, self.curr.call_id, stack_pointer).value
+        return self._rw_key_lookup(rw, _FQ_TAG_STACK, self.curr.call_id, stack_pointer).value
 
     def memory_lookup(
         self, rw: RW, memory_address: Expression, call_id: Optional[Expression] = None
     ) -> FQ:
         if call_id is None:
             call_id = self.curr.call_id
-        return cast_expr(
-            self.rw_lookup(rw, RWTableTag.Memory, call_id, memory_address).value.value(), FQ
-        )
+        value = self.rw_key_lookup(rw, RWTableTag.Memory, call_id, memory_address).value.value()
+        # The type check only runs with assertions enabled, like the constraints themselves
+        return cast_expr(value, FQ) if __debug__ else cast(FQ, value)
 
     def tx_refund_read(self, tx_id: Expression) -> FQ:
-        return cast_expr(self.rw_lookup(RW.Read, RWTableTag.TxRefund, tx_id).value.value(), FQ)
+        value = self.rw_lookup(RW.Read, RWTableTag.TxRefund, tx_id).value.value()
+        return cast_expr(value, FQ) if __debug__ else cast(FQ, value)
 
     def tx_refund_write(
         self,
@@ -930,7 +1068,10 @@ class Instruction:
             tx_id,
             reversion_info=reversion_info,
         )
-        return cast_expr(row.value.value(), FQ), cast_expr(row.value_prev.value(), FQ)
+        value, value_prev = row.value.value(), row.value_prev.value()
+        if __debug__:
+            return cast_expr(value, FQ), cast_expr(value_prev, FQ)
+        return cast(FQ, value), cast(FQ, value_prev)
 
     def account_read(
         self, account_address: Expression, account_field_tag: AccountFieldTag
@@ -941,7 +1082,10 @@ class Instruction:
         self, account_address: Expression, account_field_tag: AccountFieldTag
     ) -> WordOrValue:
         return self.rw_lookup(
-            RW.Read, RWTableTag.Account, address=account_address, field_tag=FQ(account_field_tag)
+            RW.Read,
+            RWTableTag.Account,
+            address=account_address,
+            field_tag=_fq_tag(account_field_tag),
         ).value
 
     def account_write(
@@ -962,7 +1106,7 @@ class Instruction:
         row = self.state_write(
             RWTableTag.Account,
             address=account_address,
-            field_tag=FQ(account_field_tag),
+            field_tag=_fq_tag(account_field_tag),
             reversion_info=reversion_info,
         )
         return row.value, row.value_prev
@@ -976,9 +1120,7 @@ class Instruction:
         balance, balance_prev = self.account_write_word(
             account_address, AccountFieldTag.Balance, reversion_info
         )
-        result, carry = self.add_words([balance_prev, *values])
-        self.constrain_equal_word(balance, result)
-        self.constrain_zero(carry)
+        self._constrain_balance_sum(balance, balance_prev, values)
         return balance, balance_prev
 
     def sub_balance(
@@ -990,11 +1132,18 @@ class Instruction:
         balance, balance_prev = self.account_write_word(
             account_address, AccountFieldTag.Balance, reversion_info
         )
-        result, carry = self.add_words([balance, *values])
-        self.constrain_equal_word(balance_prev, result)
-        self.constrain_zero(carry)
+        self._constrain_balance_sum(balance_prev, balance, values)
         return balance, balance_prev
 
+    def _constrain_balance_sum(self, total: Word, balance: Word, values: Sequence[Word]):
+        """Constrain that balance plus the sum of values is total, without overflow"""
+        if len(values) == 1:
+            result, carry = self.add_words_2(balance, values[0])
+        else:
+            result, carry = self.add_words([balance, *values])
+        self.constrain_equal_word(total, result)
+        self.constrain_zero(carry)
+
     def account_storage_read(
         self, account_address: Expression, storage_key: Word, tx_id: Expression
     ) -> Word:
@@ -1076,9 +1225,9 @@ class Instruction:
         gas_fee: Word,
         reversion_info: Optional[ReversionInfo] = None,
     ) -> Tuple[Tuple[Word, Word], Tuple[Word, Word]]:
-        sender_balance_pair = self.sub_balance(sender_address, [value, gas_fee], reversion_info)
-        receiver_balance_pair = self.add_balance(receiver_address, [value], reversion_info)
-        return sender_balance_pair, receiver_balance_pair
+        return self._transfer_core(
+            sender_address, receiver_address, value, [value, gas_fee], reversion_info
+        )
 
     def transfer(
         self,
@@ -1087,25 +1236,45 @@ class Instruction:
         value: Word,
         reversion_info: Optional[ReversionInfo] = None,
     ) -> Tuple[Tuple[Word, Word], Tuple[Word, Word]]:
-        sender_balance_pair = self.sub_balance(sender_address, [value], reversion_info)
-        receiver_balance_pair = self.add_balance(receiver_address, [value], reversion_info)
-        return sender_balance_pair, receiver_balance_pair
+        return self._transfer_core(sender_address, receiver_address, value, [value], reversion_info)
+
+    def _transfer_core(
+        self,
+        sender_address: Expression,
+        receiver_address: Expression,
+        value: Word,
+        sender_values: Sequence[Word],
+        reversion_info: Optional[ReversionInfo],
+    ) -> Tuple[Tuple[Word, Word], Tuple[Word, Word]]:
+        """
+        Write the sender and receiver balances and constrain that the sender paid the sum of
+        sender_values and the receiver got value, same as sub_balance followed by add_balance.
+        """
+        sender_balance, sender_balance_prev = self.account_write_word(
+            sender_address, AccountFieldTag.Balance, reversion_info
+        )
+        receiver_balance, receiver_balance_prev = self.account_write_word(
+            receiver_address, AccountFieldTag.Balance, reversion_info
+        )
+
+        self._constrain_balance_sum(sender_balance_prev, sender_balance, sender_values)
+        self._constrain_balance_sum(receiver_balance, receiver_balance_prev, [value])
+
+        return (sender_balance, sender_balance_prev), (receiver_balance, receiver_balance_prev)
 
     def memory_offset_and_length(self, offset_word: Word, length_word: Word) -> Tuple[FQ, FQ]:
         length = self.word_to_fq(length_word, N_BYTES_MEMORY_ADDRESS)
-        if self.is_zero(length) == 1:
-            return FQ(0), FQ(0)
+        if length.n == 0:
+            return _FQ_ZERO, _FQ_ZERO
         offset = self.word_to_fq(offset_word, N_BYTES_MEMORY_ADDRESS)
         return offset, length
 
     def memory_gas_cost(self, memory_size: Expression) -> FQ:
-        quadratic_cost, _ = self.constant_divmod(
-            memory_size.expr() * memory_size.expr(),
-            FQ(MEMORY_EXPANSION_QUAD_DENOMINATOR),
-            N_BYTES_GAS,
-        )
-        linear_cost = memory_size.expr() * MEMORY_EXPANSION_LINEAR_COEFF
-        return quadratic_cost + linear_cost
+        # Same as constant_divmod over the field product, computed on the integer value directly
+        memory_size_n = memory_size.expr().n
+        quadratic_cost = memory_size_n * memory_size_n % _P // MEMORY_EXPANSION_QUAD_DENOMINATOR
+        self.range_check(FQ(quadratic_cost), N_BYTES_GAS)
+        return FQ(quadratic_cost + memory_size_n * MEMORY_EXPANSION_LINEAR_COEFF)
 
     def memory_expansion(self, offset: Expression, length: Expression) -> Tuple[FQ, FQ]:
         memory_size, _ = self.constant_divmod(
@@ -1118,7 +1287,7 @@ class Instruction:
         memory_gas_cost_next = self.memory_gas_cost(next_memory_size)
         memory_expansion_gas_cost = memory_gas_cost_next - memory_gas_cost
 
-        return cast_expr(next_memory_size, FQ), cast_expr(memory_expansion_gas_cost, FQ)
+        return next_memory_size, memory_expansion_gas_cost
 
     def memory_expansion_dynamic_length(
         self,
@@ -1130,19 +1299,23 @@ class Instruction:
         cd_memory_size, _ = self.constant_divmod(
             cd_offset.expr() + cd_length.expr() + FQ(31), FQ(32), N_BYTES_MEMORY_SIZE
         )
-        next_memory_size = self.max(self.curr.memory_word_size, cd_memory_size, N_BYTES_MEMORY_SIZE)
-
         if rd_offset is not None and rd_length is not None:
             rd_memory_size, _ = self.constant_divmod(
                 rd_offset.expr() + rd_length.expr() + FQ(31), FQ(32), N_BYTES_MEMORY_SIZE
             )
-            next_memory_size = self.max(next_memory_size, rd_memory_size, N_BYTES_MEMORY_SIZE)
+            next_memory_size = self.max3(
+                self.curr.memory_word_size, cd_memory_size, rd_memory_size, N_BYTES_MEMORY_SIZE
+            )
+        else:
+            next_memory_size = self.max(
+                self.curr.memory_word_size, cd_memory_size, N_BYTES_MEMORY_SIZE
+            )
 
         memory_gas_cost = self.memory_gas_cost(self.curr.memory_word_size)
         memory_gas_cost_next = self.memory_gas_cost(next_memory_size)
         memory_expansion_gas_cost = memory_gas_cost_next - memory_gas_cost
 
-        return cast_expr(next_memory_size, FQ), cast_expr(memory_expansion_gas_cost, FQ)
+        return next_memory_size, memory_expansion_gas_cost
 
     def memory_copier_gas_cost(
         self,
@@ -1156,27 +1329,21 @@ class Instruction:
         return gas_cost
 
     def generate_contract_address(self, address: Expression, nonce: Expression) -> Expression:
-        contract_addr = keccak(rlp.encode([address.expr().n.to_bytes(20, "big"), nonce.expr().n]))
-        return FQ(int.from_bytes(contract_addr[-20:], "big"))
+        return FQ(_contract_address(address.expr().n, nonce.expr().n))
 
     def generate_CREAET2_contract_address(
         self, address: Expression, salt: Word, code_hash: Word
     ) -> Expression:
-        # keccak256(0xff + sender_address + salt + keccak256(initialisation_code))[12:]
-        contract_addr = keccak(
-            b"\xff"
-            + address.expr().n.to_bytes(20, "big")
-            + salt.int_value().to_bytes(32, "little")
-            + code_hash.int_value().to_bytes(32, "little")
+        return FQ(
+            _create2_contract_address(address.expr().n, salt.int_value(), code_hash.int_value())
         )
-        return FQ(int.from_bytes(contract_addr[-20:], "big"))
 
     def pow2_lookup(self, value: Expression, pow_lo128: Expression, pow_hi128: Expression):
         self.fixed_lookup(FixedTableTag.Pow2, value, pow_lo128, pow_hi128)
 
     # `sign_byte == 0xff` if (value as i8 < 0) otherwise `sign_byte == 0`.
     def sign_byte_lookup(self, value: Expression, sign_byte: Expression):
-        self.fixed_lookup(FixedTableTag.SignByte, value, sign_byte, FQ(0))
+        self.fixed_lookup(FixedTableTag.SignByte, value, sign_byte, _FQ_ZERO)
 
     def copy_lookup(
         self,
@@ -1218,14 +1385,21 @@ class Instruction:
         exp_table_row = self.tables.exp_lookup(identifier, is_last, base_limbs, exponent)
         return exp_table_row.exponentiation
 
+    def constrain_next_state_iff(self, cond: bool, state: ExecutionState):
+        """Constrain the next step to be in `state` if and only if `cond` holds"""
+        is_to_state = self.next.execution_state == state
+        assert is_to_state == bool(cond), ConstraintUnsatFailure(
+            f"Expected next execution state to be {state} iff {cond}, "
+            f"but got {self.next.execution_state}"
+        )
+
     def constrain_error_state(self, rw_counter_delta: int):
         # Current call must fail.
         is_success = self.call_context_lookup(CallContextFieldTag.IsSuccess)
         self.constrain_equal(is_success, FQ(0))
 
         # Go to EndTx only when is_root.
-        is_to_end_tx = self.is_equal(self.next.execution_state, ExecutionState.EndTx)
-        self.constrain_equal(FQ(self.curr.is_root), is_to_end_tx)
+        self.constrain_next_state_iff(self.curr.is_root, ExecutionState.EndTx)
 
         # When it's a root call.
         if self.curr.is_root:
@@ -22,6 +22,7 @@ def verify_steps(
         steps.append(DUMMY_STEP_STATE)
 
     exception = None
+    last_idx = len(steps) - 2
     for idx, (curr, next) in enumerate(zip(steps, steps[1:])):
         try:
             verify_step(
@@ -30,7 +31,7 @@ def verify_steps(
                     curr=curr,
                     next=next,
                     is_first_step=begin_with_first_step and idx == 0,
-                    is_last_step=end_with_last_step and idx == len(steps) - 2,
+                    is_last_step=end_with_last_step and idx == last_idx,
                 )
             )
         except AssertionError as e:
@@ -57,7 +58,7 @@ def verify_step(instruction: Instruction):
     else:
         instruction.constrain_execution_state_transition()
 
-    if instruction.curr.execution_state in EXECUTION_STATE_IMPL:
-        EXECUTION_STATE_IMPL[instruction.curr.execution_state](instruction)
-    else:
+    impl = EXECUTION_STATE_IMPL.get(instruction.curr.execution_state)
+    if impl is None:
         raise NotImplementedError
+    impl(instruction)
@@ -1,5 +1,18 @@
 from __future__ import annotations
-from typing import Any, List, Mapping, Optional, Sequence, Set, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from enum import IntEnum, auto
 from itertools import chain, product
 from dataclasses import dataclass, field, fields
@@ -375,18 +388,17 @@ class TableRow:
             raise WrongQueryKey(table_name, queried - names)
 
     def match(self, query: Mapping[str, Union[Expression, Word]]) -> bool:
-        match = True
         for key, value in query.items():
             rhs = getattr(self, key)
             if isinstance(value, Word):
                 assert isinstance(rhs, Word)
-                match = match and (
-                    value.lo.expr() == rhs.lo.expr() and value.hi.expr() == rhs.hi.expr()
-                )
+                if not (value.lo.expr() == rhs.lo.expr() and value.hi.expr() == rhs.hi.expr()):
+                    return False
             else:
                 assert isinstance(value, Expression) and isinstance(rhs, Expression)
-                match = match and (value.expr() == rhs.expr())
-        return match
+                if not value.expr() == rhs.expr():
+                    return False
+        return True
 
 
 @dataclass(frozen=True)
@@ -538,6 +550,8 @@ class Tables:
     tx_table: Set[TxTableRow]
     bytecode_table: Set[BytecodeTableRow]
     rw_table: Set[RWTableRow]
+    # rw_table rows grouped by rw_counter, which every rw lookup pins down
+    rw_table_by_counter: Dict[int, List[RWTableRow]]
     copy_table: Set[CopyTableRow]
     keccak_table: Set[KeccakTableRow]
     exp_table: Set[ExpTableRow]
@@ -559,6 +573,9 @@ class Tables:
             row if isinstance(row, RWTableRow) else RWTableRow(*row)  # type: ignore  # (RWTableRow input args)
             for row in rw_table
         )
+        self.rw_table_by_counter = {}
+        for row in self.rw_table:
+            self.rw_table_by_counter.setdefault(row.rw_counter.expr().n, []).append(row)
         if copy_circuit is not None:
             self.copy_table = self._convert_copy_circuit_to_table(copy_circuit)
         if keccak_table is not None:
@@ -686,7 +703,34 @@ class Tables:
             "value_prev": value_prev,
             "aux0": aux0,
         }
-        return lookup(RWTableRow, self.rw_table, query)
+        rows = self.rw_table_by_counter.get(rw_counter.expr().n, [])
+        return lookup(RWTableRow, rows, query)
+
+    def rw_key_lookup(
+        self,
+        rw_counter: Expression,
+        rw: Expression,
+        tag: Expression,
+        id: Expression,
+        address: Expression,
+    ) -> RWTableRow:
+        """
+        Fast path of rw_lookup for queries on (rw_counter, rw, tag, id, address) only, which
+        compares the keys as integers instead of going through the generic query matching.
+        """
+        key = (rw.expr().n, tag.expr().n, id.expr().n, address.expr().n)
+        matched_rows = [
+            row
+            for row in self.rw_table_by_counter.get(rw_counter.expr().n, [])
+            if (row.rw.expr().n, row.key0.expr().n, row.id.expr().n, row.address.expr().n) == key
+        ]
+        if len(matched_rows) == 1:
+            return matched_rows[0]
+
+        query = {"rw_counter": rw_counter, "rw": rw, "key0": tag, "id": id, "address": address}
+        if len(matched_rows) == 0:
+            raise LookupUnsatFailure(RWTableRow.__name__, query)
+        raise LookupAmbiguousFailure(RWTableRow.__name__, query, matched_rows)
 
     def copy_lookup(
         self,
@@ -750,18 +794,15 @@ T = TypeVar("T", bound=TableRow)
 
 def lookup(
     table_cls: Type[T],
-    table: Set[T],
+    table: Iterable[T],
     query: Mapping[str, Optional[Union[FQ, Expression, Word]]],
 ) -> T:
     table_name = table_cls.__name__
     table_cls.validate_query(table_name, query)
 
-    matched_rows = [
-        row
-        for row in table
-        # Filter out None values
-        if row.match({key: value for key, value in query.items() if value is not None})
-    ]
+    # Filter out None values
+    filtered_query = {key: value for key, value in query.items() if value is not None}
+    matched_rows = [row for row in table if row.match(filtered_query)]
 
     if len(matched_rows) == 0:
         raise LookupUnsatFailure(table_name, query)
@@ -14,7 +14,7 @@ from typing import (
     Mapping,
     Tuple,
 )
-from functools import reduce
+from functools import lru_cache, reduce
 from itertools import chain
 
 from ..util import (
@@ -281,6 +281,12 @@ def init_is_code(code: bytearray) -> MutableSequence[bool]:
     return is_codes
 
 
+@lru_cache(maxsize=1024)
+def _bytecode_hash(code: bytes) -> U256:
+    """Keccak256 of the bytecode, memoized on the code since tests hash the same code repeatedly"""
+    return U256(int.from_bytes(keccak256(code), "big"))
+
+
 class Bytecode:
     code: bytearray
     is_code: MutableSequence[bool]
@@ -342,7 +348,7 @@ class Bytecode:
         return self
 
     def hash(self) -> U256:
-        return U256(int.from_bytes(keccak256(self.code), "big"))
+        return _bytecode_hash(bytes(self.code))
 
     def table_assignments(self) -> Iterator[BytecodeTableRow]:
         class BytecodeIterator:
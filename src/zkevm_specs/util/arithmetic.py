@@ -212,11 +212,23 @@ def sum_values(values: Sequence[IntOrFQ]) -> FQ:
 
 
 def add_words(addends: Sequence[Word]) -> Tuple[Word, FQ]:
-    addends_lo, addends_hi = list(zip(*[w.to_lo_hi() for w in addends]))
+    # Limbs are summed as plain integers and reduced into the field once per limb
+    carry_lo, sum_lo = divmod(
+        sum(addend.lo.expr().n for addend in addends) % FQ.field_modulus, 1 << 128
+    )
+    carry_hi, sum_hi = divmod(
+        (sum(addend.hi.expr().n for addend in addends) + carry_lo) % FQ.field_modulus, 1 << 128
+    )
 
-    carry_lo, sum_lo = divmod(sum_values(addends_lo).n, 1 << 128)
-    carry_hi, sum_hi = divmod((sum_values(addends_hi) + carry_lo).n, 1 << 128)
+    return Word((FQ(sum_lo), FQ(sum_hi))), FQ(carry_hi)
 
+
+def add_words_2(a: Word, b: Word) -> Tuple[Word, FQ]:
+    """Same as add_words([a, b]), without building the addends list"""
+    carry_lo, sum_lo = divmod((a.lo.expr().n + b.lo.expr().n) % FQ.field_modulus, 1 << 128)
+    carry_hi, sum_hi = divmod(
+        (a.hi.expr().n + b.hi.expr().n + carry_lo) % FQ.field_modulus, 1 << 128
+    )
     return Word((FQ(sum_lo), FQ(sum_hi))), FQ(carry_hi)
 
 
@@ -227,31 +239,84 @@ def mul_add_words(
     The function constrains a * b + c == d, where a, b, c, d are 256-bit words.
     It returns the overflow part of a * b + c.
     """
-    a64s = a.to_64s()
-    b64s = b.to_64s()
-    c_lo, c_hi = c.lo.expr(), c.hi.expr()
     d_lo, d_hi = d.lo.expr(), d.hi.expr()
-
-    t0 = a64s[0] * b64s[0]
-    t1 = a64s[0] * b64s[1] + a64s[1] * b64s[0]
-    t2 = a64s[0] * b64s[2] + a64s[1] * b64s[1] + a64s[2] * b64s[0]
-    t3 = a64s[0] * b64s[3] + a64s[1] * b64s[2] + a64s[2] * b64s[1] + a64s[3] * b64s[0]
-    carry_lo = (t0 + (t1 * 2**64) + c_lo - d_lo) / (2**128)
-    carry_hi = (t2 + (t3 * 2**64) + c_hi + carry_lo - d_hi) / (2**128)
-    overflow = (
-        carry_hi
-        + a64s[1] * b64s[3]
-        + a64s[2] * b64s[2]
-        + a64s[3] * b64s[1]
-        + a64s[2] * b64s[3]
-        + a64s[3] * b64s[2]
-        + a64s[3] * b64s[3]
+    lo_sum, hi_sum, carry_lo, carry_hi, overflow = mul_add_words_int(
+        word_to_u64s(a), word_to_u64s(b), c.lo.expr().n, c.hi.expr().n, d_lo.n, d_hi.n
     )
 
-    constraint1 = (t0 + t1 * (2**64) + c_lo, d_lo + carry_lo * (2**128))
-    constraint2 = (t2 + t3 * (2**64) + c_hi + carry_lo, d_hi + carry_hi * (2**128))
+    constraint1 = (FQ(lo_sum), d_lo + FQ(carry_lo) * (2**128))
+    constraint2 = (FQ(hi_sum), d_hi + FQ(carry_hi) * (2**128))
+
+    return FQ(overflow), (FQ(carry_lo), FQ(carry_hi)), [constraint1, constraint2]
+
+
+# Carries of the integer word arithmetic are divided out by multiplying with the precomputed
+# inverse of 2^128 instead of doing a field inversion on every call.
+_INV_2_128 = prime_field_inv(1 << 128, FQ.field_modulus)
+_MASK_64 = (1 << 64) - 1
 
-    return overflow, (carry_lo, carry_hi), [constraint1, constraint2]
+
+def word_to_u64s(word: Word) -> Tuple[int, int, int, int]:
+    """Split a word into its four 64-bit limbs as ints, least significant first"""
+    lo, hi = word.lo.expr().n, word.hi.expr().n
+    return lo & _MASK_64, lo >> 64, hi & _MASK_64, hi >> 64
+
+
+def mul_add_words_int(
+    a: Tuple[int, int, int, int],
+    b: Tuple[int, int, int, int],
+    c_lo: int,
+    c_hi: int,
+    d_lo: int,
+    d_hi: int,
+) -> Tuple[int, int, int, int, int]:
+    """
+    Integer core of mul_add_words on the 64-bit limbs of a and b. Works on plain ints and only
+    reduces modulo the field where the gadget divides by 2^128, returning (lo_sum, hi_sum,
+    carry_lo, carry_hi, overflow) where lo_sum/hi_sum are the left hand sides of the two limb
+    equations.
+    """
+    t0 = a[0] * b[0]
+    t1 = a[0] * b[1] + a[1] * b[0]
+    t2 = a[0] * b[2] + a[1] * b[1] + a[2] * b[0]
+    t3 = a[0] * b[3] + a[1] * b[2] + a[2] * b[1] + a[3] * b[0]
+    lo_sum = t0 + (t1 << 64) + c_lo
+    carry_lo = (lo_sum - d_lo) * _INV_2_128 % FQ.field_modulus
+    hi_sum = t2 + (t3 << 64) + c_hi + carry_lo
+    carry_hi = (hi_sum - d_hi) * _INV_2_128 % FQ.field_modulus
+    overflow = (
+        carry_hi + a[1] * b[3] + a[2] * b[2] + a[3] * b[1] + a[2] * b[3] + a[3] * b[2] + a[3] * b[3]
+    )
+    return lo_sum, hi_sum, carry_lo, carry_hi, overflow
+
+
+def mul_add_words_512_int(
+    a: Tuple[int, int, int, int],
+    b: Tuple[int, int, int, int],
+    c_lo: int,
+    c_hi: int,
+    d_lo: int,
+    e_lo: int,
+    e_hi: int,
+) -> Tuple[int, int, int, int, int, int, int]:
+    """
+    Integer core of the a * b + c == d * 2**256 + e gadget, returning the left hand sides of the
+    three carried limb equations, the carries, and the top limb sum.
+    """
+    t0 = a[0] * b[0]
+    t1 = a[0] * b[1] + a[1] * b[0]
+    t2 = a[0] * b[2] + a[1] * b[1] + a[2] * b[0]
+    t3 = a[0] * b[3] + a[1] * b[2] + a[2] * b[1] + a[3] * b[0]
+    t4 = a[1] * b[3] + a[2] * b[2] + a[3] * b[1]
+    t5 = a[2] * b[3] + a[3] * b[2]
+    t6 = a[3] * b[3]
+    sum_0 = t0 + (t1 << 64) + c_lo
+    carry_0 = (sum_0 - e_lo) * _INV_2_128 % FQ.field_modulus
+    sum_1 = t2 + (t3 << 64) + c_hi + carry_0
+    carry_1 = (sum_1 - e_hi) * _INV_2_128 % FQ.field_modulus
+    sum_2 = t4 + (t5 << 64) + carry_1
+    carry_2 = (sum_2 - d_lo) * _INV_2_128 % FQ.field_modulus
+    return sum_0, sum_1, sum_2, carry_0, carry_1, carry_2, t6 + carry_2
 
 
 def get_int_abs(x: int) -> int:
@@ -1,5 +1,7 @@
-from typing import Union
+import hashlib
+from typing import AbstractSet, Optional, Union, cast
 from Crypto.Hash import keccak
+from eth_hash.auto import keccak as _eth_hash_keccak256
 
 from .typing import U256
 
@@ -10,6 +12,25 @@ def keccak256(data: Union[str, bytes, bytearray]) -> bytes:
     return keccak.new(digest_bits=256).update(data).digest()
 
 
+def _hashlib_keccak256_name(algorithms: AbstractSet[str]) -> Optional[str]:
+    """
+    Name of the legacy Keccak-256 (not to be confused with SHA3-256) among hashlib's algorithms.
+    OpenSSL >= 3.2 exposes it, backed by its assembly implementation.
+    """
+    return next((name for name in ("keccak-256", "keccak_256") if name in algorithms), None)
+
+
+_HASHLIB_KECCAK256 = _hashlib_keccak256_name(hashlib.algorithms_available)
+
+
+def _hashlib_keccak256(data: bytes) -> bytes:
+    return hashlib.new(cast(str, _HASHLIB_KECCAK256), data).digest()
+
+
+# Keccak-256 of raw bytes, through hashlib when it has Keccak-256 and eth-hash otherwise.
+keccak256_bytes = _eth_hash_keccak256 if _HASHLIB_KECCAK256 is None else _hashlib_keccak256
+
+
 EMPTY_HASH: U256 = U256(int.from_bytes(keccak256(""), "big"))
 EMPTY_CODE_HASH: U256 = EMPTY_HASH
 EMPTY_TRIE_HASH: U256 = U256(int.from_bytes(keccak256("80"), "big"))
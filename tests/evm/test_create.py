@@ -17,6 +17,7 @@ from zkevm_specs.evm_circuit import (
     Tables,
     verify_steps,
 )
+from zkevm_specs.evm_circuit import instruction
 from zkevm_specs.evm_circuit.table import CopyDataTypeTag
 from zkevm_specs.evm_circuit.typing import CopyCircuit
 from zkevm_specs.util.hash import EMPTY_CODE_HASH, keccak256
@@ -363,3 +364,12 @@ def test_create_create2(
             ),
         ],
     )
+
+
+@pytest.mark.parametrize(
+    "nonce",
+    [0, 1, 0x7F, 0x80, 0xFF, 0x100, 2**56 - 1, 2**56, 2**56 + 1, 2**64 - 1],
+)
+def test_create_rlp(nonce: int):
+    address = bytes(range(1, 21))
+    assert instruction._create_rlp(address, nonce) == rlp.encode([address, nonce])
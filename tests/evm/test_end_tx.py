@@ -86,10 +86,17 @@ TESTING_DATA = (
 )
 
 
+@pytest.fixture(scope="module")
+def block_and_table():
+    block = Block()
+    return block, set(block.table_assignments())
+
+
 @pytest.mark.parametrize(
     "tx, gas_left, refund, is_last_tx, current_cumulative_gas_used, success", TESTING_DATA
 )
 def test_end_tx(
+    block_and_table,
     tx: Transaction,
     gas_left: int,
     refund: int,
@@ -97,7 +104,7 @@ def test_end_tx(
     current_cumulative_gas_used: int,
     success: bool,
 ):
-    block = Block()
+    block, block_table = block_and_table
     effective_refund = min(refund, (tx.gas - gas_left) // MAX_REFUND_QUOTIENT_OF_GAS_USED)
     caller_balance_prev = int(1e18) - (tx.value + tx.gas * tx.gas_price)
     caller_balance = caller_balance_prev + (gas_left + effective_refund) * tx.gas_price
@@ -138,7 +145,7 @@ def test_end_tx(
         rw_dictionary.call_context_read(27 - is_first_tx, CallContextFieldTag.TxId, tx.id + 1)
 
     tables = Tables(
-        block_table=set(block.table_assignments()),
+        block_table=block_table,
         tx_table=set(tx.table_assignments()),
         bytecode_table=set(),
         rw_table=set(rw_dictionary.rws),
@@ -20,18 +20,28 @@ TESTING_DATA = (
     0xF0FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF0F,
 )
 
+BYTECODE = Bytecode().gasprice().stop()
+BYTECODE_HASH = Word(BYTECODE.hash())
+
+
+@pytest.fixture(scope="module")
+def block_table():
+    return set(Block().table_assignments())
+
+
+@pytest.fixture(scope="module")
+def bytecode_table():
+    return set(BYTECODE.table_assignments())
+
 
 @pytest.mark.parametrize("gasprice", TESTING_DATA)
-def test_gasprice(gasprice: U256):
+def test_gasprice(block_table, bytecode_table, gasprice: U256):
     tx = Transaction(gas_price=gasprice)
 
-    bytecode = Bytecode().gasprice().stop()
-    bytecode_hash = Word(bytecode.hash())
-
     tables = Tables(
-        block_table=set(Block().table_assignments()),
+        block_table=block_table,
         tx_table=set(tx.table_assignments()),
-        bytecode_table=set(bytecode.table_assignments()),
+        bytecode_table=bytecode_table,
         rw_table=set(
             RWDictionary(9)
             .call_context_read(1, CallContextFieldTag.TxId, tx.id)
@@ -49,7 +59,7 @@ def test_gasprice(gasprice: U256):
                 call_id=1,
                 is_root=True,
                 is_create=False,
-                code_hash=bytecode_hash,
+                code_hash=BYTECODE_HASH,
                 program_counter=0,
                 stack_pointer=1024,
                 gas_left=2,
@@ -60,7 +70,7 @@ def test_gasprice(gasprice: U256):
                 call_id=1,
                 is_root=True,
                 is_create=False,
-                code_hash=bytecode_hash,
+                code_hash=BYTECODE_HASH,
                 program_counter=1,
                 stack_pointer=1023,
                 gas_left=0,
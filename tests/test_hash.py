@@ -0,0 +1,38 @@
+import hashlib
+import pytest
+from zkevm_specs.util import hash as util_hash
+
+
+def test_keccak256_bytes_empty_input():
+    # Legacy Keccak-256, not SHA3-256, of the empty input
+    assert (
+        util_hash.keccak256_bytes(b"").hex()
+        == "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"
+    )
+
+
+@pytest.mark.parametrize(
+    "algorithms, expected",
+    [
+        ({"sha256", "sha3_256"}, None),
+        ({"sha3_256", "keccak-256"}, "keccak-256"),
+        ({"keccak_256"}, "keccak_256"),
+    ],
+)
+def test_hashlib_keccak256_name(algorithms, expected):
+    assert util_hash._hashlib_keccak256_name(algorithms) == expected
+
+
+def test_keccak256_bytes_backend():
+    if "sha3_256" in hashlib.algorithms_available:
+        # SHA3-256 must never be picked up as Keccak-256
+        assert util_hash.keccak256_bytes(b"") != hashlib.sha3_256(b"").digest()
+    assert util_hash.keccak256_bytes(b"\x00" * 100) == util_hash.keccak256(b"\x00" * 100)
+
+
+@pytest.mark.skipif(
+    util_hash._HASHLIB_KECCAK256 is None, reason="hashlib has no Keccak-256 backend"
+)
+@pytest.mark.parametrize("data", [b"", b"\x00", bytes(range(256)) * 3])
+def test_hashlib_keccak256(data: bytes):
+    assert util_hash._hashlib_keccak256(data) == util_hash._eth_hash_keccak256(data)